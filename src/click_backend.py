@@ -0,0 +1,188 @@
+"""
+Click Backend Module
+Low-overhead, platform-native mouse button injection with a pynput fallback.
+"""
+
+import logging
+import sys
+from typing import Dict, Optional
+from pynput.mouse import Button, Controller as MouseController
+
+logger = logging.getLogger(__name__)
+
+
+class PynputClickBackend:
+    """Fallback backend that clicks through pynput's Controller"""
+    
+    name = "pynput"
+    
+    def __init__(self, mouse: MouseController):
+        self._mouse = mouse
+    
+    def click(self, button: Button, position: Optional[tuple[int, int]] = None) -> None:
+        """Press and release a mouse button at the current cursor position"""
+        self._mouse.click(button)
+
+
+class WindowsClickBackend:
+    """
+    Clicks via a single user32.SendInput call per click.
+    The down/up INPUT pairs are built once per button and reused.
+    """
+    
+    name = "sendinput"
+    
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_RIGHTDOWN = 0x0008
+    MOUSEEVENTF_RIGHTUP = 0x0010
+    MOUSEEVENTF_MIDDLEDOWN = 0x0020
+    MOUSEEVENTF_MIDDLEUP = 0x0040
+    
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+        
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [
+                ("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+            ]
+        
+        class _INPUTUNION(ctypes.Union):
+            # MOUSEINPUT is the largest member, so it alone fixes the size
+            _fields_ = [("mi", MOUSEINPUT)]
+        
+        class INPUT(ctypes.Structure):
+            _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+        
+        InputPair = INPUT * 2
+        
+        self._send_input = ctypes.windll.user32.SendInput
+        self._send_input.argtypes = (wintypes.UINT, ctypes.c_void_p, ctypes.c_int)
+        self._send_input.restype = wintypes.UINT
+        self._input_size = ctypes.sizeof(INPUT)
+        self._byref = ctypes.byref
+        
+        flags = {
+            Button.left: (self.MOUSEEVENTF_LEFTDOWN, self.MOUSEEVENTF_LEFTUP),
+            Button.right: (self.MOUSEEVENTF_RIGHTDOWN, self.MOUSEEVENTF_RIGHTUP),
+            Button.middle: (self.MOUSEEVENTF_MIDDLEDOWN, self.MOUSEEVENTF_MIDDLEUP),
+        }
+        self._pairs: Dict[Button, ctypes.Array] = {}
+        for button, (down, up) in flags.items():
+            pair = InputPair()
+            pair[0].type = pair[1].type = self.INPUT_MOUSE
+            pair[0].union.mi.dwFlags = down
+            pair[1].union.mi.dwFlags = up
+            self._pairs[button] = pair
+    
+    def click(self, button: Button, position: Optional[tuple[int, int]] = None) -> None:
+        """Press and release a mouse button at the current cursor position"""
+        pair = self._pairs.get(button, self._pairs[Button.left])
+        self._send_input(2, self._byref(pair), self._input_size)
+
+
+class X11ClickBackend:
+    """Clicks via the XTEST extension over one persistent X connection"""
+    
+    name = "xtest"
+    
+    def __init__(self):
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        
+        self._display = display.Display()
+        if not self._display.has_extension("XTEST"):
+            self._display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        
+        self._fake_input = xtest.fake_input
+        self._press = X.ButtonPress
+        self._release = X.ButtonRelease
+        self._codes = {
+            Button.left: 1,
+            Button.middle: 2,
+            Button.right: 3,
+        }
+    
+    def click(self, button: Button, position: Optional[tuple[int, int]] = None) -> None:
+        """Press and release a mouse button at the current cursor position"""
+        code = self._codes.get(button, 1)
+        self._fake_input(self._display, self._press, code)
+        self._fake_input(self._display, self._release, code)
+        self._display.flush()
+
+
+class MacClickBackend:
+    """Clicks via Quartz CGEventPost, reusing one CGEvent per button"""
+    
+    name = "quartz"
+    
+    def __init__(self):
+        import Quartz
+        
+        self._quartz = Quartz
+        types = {
+            Button.left: (Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp,
+                          Quartz.kCGMouseButtonLeft),
+            Button.right: (Quartz.kCGEventRightMouseDown, Quartz.kCGEventRightMouseUp,
+                           Quartz.kCGMouseButtonRight),
+            Button.middle: (Quartz.kCGEventOtherMouseDown, Quartz.kCGEventOtherMouseUp,
+                            Quartz.kCGMouseButtonCenter),
+        }
+        origin = Quartz.CGPointMake(0, 0)
+        self._events = {}
+        for button, (down, up, cg_button) in types.items():
+            event = Quartz.CGEventCreateMouseEvent(None, down, origin, cg_button)
+            self._events[button] = (event, down, up)
+    
+    def click(self, button: Button, position: Optional[tuple[int, int]] = None) -> None:
+        """
+        Press and release a mouse button.
+        
+        Args:
+            button: Mouse button to click
+            position: Known cursor position; when omitted the current
+                location is queried, which allocates a throwaway CGEvent
+        """
+        q = self._quartz
+        event, down, up = self._events.get(button, self._events[Button.left])
+        if position is not None:
+            location = q.CGPointMake(*position)
+        else:
+            location = q.CGEventGetLocation(q.CGEventCreate(None))
+        q.CGEventSetLocation(event, location)
+        q.CGEventSetType(event, down)
+        q.CGEventPost(q.kCGHIDEventTap, event)
+        q.CGEventSetType(event, up)
+        q.CGEventPost(q.kCGHIDEventTap, event)
+
+
+def create_click_backend(mouse: MouseController):
+    """
+    Create the fastest click backend available on this platform.
+    
+    Args:
+        mouse: pynput Controller used if no native backend can be set up
+        
+    Returns:
+        A backend object exposing click(button)
+    """
+    if sys.platform == "win32":
+        native = WindowsClickBackend
+    elif sys.platform == "darwin":
+        native = MacClickBackend
+    else:
+        native = X11ClickBackend
+    
+    try:
+        return native()
+    except Exception as e:
+        logger.warning("Native click backend unavailable, using pynput: %s", e)
+        return PynputClickBackend(mouse)
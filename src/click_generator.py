@@ -3,6 +3,8 @@ Click Generator Module
 Generates automated mouse clicks with configurable intervals and patterns.
 """
 
+import itertools
+import logging
 import threading
 import time
 import random
@@ -11,6 +13,19 @@ from dataclasses import dataclass
 from typing import Optional, Callable
 from pynput.mouse import Button, Controller as MouseController
 
+import timer_resolution
+from click_backend import create_click_backend
+
+logger = logging.getLogger(__name__)
+
+
+# Config button names to pynput buttons
+_BUTTON_MAP = {
+    "left": Button.left,
+    "right": Button.right,
+    "middle": Button.middle,
+}
+
 
 class ClickPattern(Enum):
     """Click intensity patterns"""
@@ -33,7 +48,7 @@ class ClickConfig:
 class ClickGenerator:
     """
     Generates automated mouse clicks at configurable intervals.
-    Uses pynput for cross-platform mouse control.
+    Uses a native click backend where available, falling back to pynput.
     """
     
     # Interval limits from PRD
@@ -41,16 +56,42 @@ class ClickGenerator:
     MAX_INTERVAL_MS = 10000
     DEFAULT_INTERVAL_MS = 200
     
+    # Maximum lag behind schedule before the loop re-anchors its deadline
+    MAX_SCHEDULE_LAG_S = 1.0
+    
+    # Gap between clicks within a burst
+    BURST_GAP_S = 0.05
+    
     def __init__(self):
         self._mouse = MouseController()
+        self._backend = create_click_backend(self._mouse)
         self._config = ClickConfig()
-        self._clicking = False
+        self._button = Button.left
+        # Set while idle; cleared for the lifetime of a click run
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        self._high_resolution = False
         self._click_thread: Optional[threading.Thread] = None
         self._click_count = 0
+        # next() on itertools.count is atomic under the GIL, so the hot
+        # path can bump the count without taking a lock
+        self._counter = itertools.count(1)
         self._start_time: Optional[float] = None
         self._target_position: Optional[tuple[int, int]] = None
+        # Where the cursor was last warped to; the pointer is never read back
+        self._last_set_position: Optional[tuple[int, int]] = None
         self._on_click_callback: Optional[Callable[[int], None]] = None
         self._lock = threading.Lock()
+        # Private RNG (seeded from os.urandom) rather than the shared module one
+        self._rng = random.Random()
+        
+        # Interval math and pattern dispatch are resolved once when settings change
+        self._base_interval_s = 0.0
+        self._variance_s = 0.0
+        self._burst_pause_s = 0.0
+        self._loop_fn: Callable[[float], float] = self._loop_constant
+        self._settings_changed = False
+        self._update_timing()
     
     def start_clicking(
         self,
@@ -69,20 +110,29 @@ class ClickGenerator:
         Returns:
             True if clicking started successfully
         """
-        if self._clicking:
+        if self.is_clicking:
             return False
         
         # Update config if provided
         if interval_ms is not None:
             self.set_interval(interval_ms)
         if pattern is not None:
-            self._config.pattern = pattern
+            self.set_pattern(pattern)
         
         self._target_position = target_position
-        self._clicking = True
+        # The user may have moved the cursor since the last run
+        self._last_set_position = None
+        self._stop_event.clear()
+        self._counter = itertools.count(1)
         self._click_count = 0
         self._start_time = time.time()
         
+        # Finer OS timer granularity only while clicking (power cost otherwise);
+        # guarded like stop_clicking so the refcount stays paired
+        if not self._high_resolution:
+            timer_resolution.begin_high_resolution()
+            self._high_resolution = True
+        
         self._click_thread = threading.Thread(
             target=self._click_loop,
             daemon=True
@@ -93,10 +143,13 @@ class ClickGenerator:
     
     def stop_clicking(self) -> None:
         """Stop automated clicking immediately"""
-        self._clicking = False
+        self._stop_event.set()
         if self._click_thread:
             self._click_thread.join(timeout=1.0)
             self._click_thread = None
+        if self._high_resolution:
+            timer_resolution.end_high_resolution()
+            self._high_resolution = False
     
     def set_interval(self, interval_ms: int) -> None:
         """Set the click interval, enforcing min/max limits"""
@@ -105,20 +158,24 @@ class ClickGenerator:
                 self.MIN_INTERVAL_MS,
                 min(self.MAX_INTERVAL_MS, interval_ms)
             )
+            self._update_timing()
     
     def set_pattern(self, pattern: ClickPattern) -> None:
         """Set the click pattern"""
         with self._lock:
             self._config.pattern = pattern
+            self._update_timing()
     
     def set_mouse_button(self, button: str) -> None:
         """Set the mouse button to click (left, right, middle)"""
         with self._lock:
             self._config.mouse_button = button.lower()
+            self._button = _BUTTON_MAP.get(self._config.mouse_button, Button.left)
     
     def set_target_position(self, position: Optional[tuple[int, int]]) -> None:
         """Set the target click position"""
         self._target_position = position
+        self._last_set_position = None
     
     def on_click(self, callback: Callable[[int], None]) -> None:
         """Register callback for click events"""
@@ -141,86 +198,144 @@ class ClickGenerator:
     @property
     def is_clicking(self) -> bool:
         """Check if currently clicking"""
-        return self._clicking
-    
-    def _get_mouse_button(self) -> Button:
-        """Get the pynput Button for the configured mouse button"""
-        button_map = {
-            "left": Button.left,
-            "right": Button.right,
-            "middle": Button.middle,
-        }
-        return button_map.get(self._config.mouse_button, Button.left)
+        return (
+            not self._stop_event.is_set()
+            and self._click_thread is not None
+            and self._click_thread.is_alive()
+        )
     
-    def _calculate_interval(self) -> float:
-        """Calculate the next interval based on pattern"""
-        base_interval = self._config.interval_ms / 1000.0  # Convert to seconds
-        
-        if self._config.pattern == ClickPattern.CONSTANT:
-            return base_interval
-        
-        elif self._config.pattern == ClickPattern.RANDOM:
-            # Add ±variation_percent variance
-            variance = base_interval * (self._config.variation_percent / 100.0)
-            return base_interval + random.uniform(-variance, variance)
+    def _update_timing(self) -> None:
+        """Recompute cached interval values and the click loop for the pattern"""
+        self._base_interval_s = self._config.interval_ms / 1000.0  # Convert to seconds
+        self._variance_s = self._base_interval_s * (self._config.variation_percent / 100.0)
+        self._burst_pause_s = self._config.burst_pause_ms / 1000.0
         
-        elif self._config.pattern == ClickPattern.BURST:
-            # Burst mode handled in click loop
-            return base_interval
+        loop_fns = {
+            ClickPattern.CONSTANT: self._loop_constant,
+            ClickPattern.RANDOM: self._loop_random,
+            ClickPattern.BURST: self._loop_burst,
+        }
+        self._loop_fn = loop_fns.get(self._config.pattern, self._loop_constant)
         
-        return base_interval
+        # Make a running loop pick up the new values
+        self._settings_changed = True
     
     def _perform_click(self) -> None:
         """Perform a single mouse click"""
-        button = self._get_mouse_button()
-        
-        # Move to target position if specified
-        if self._target_position:
-            self._mouse.position = self._target_position
+        # Move to target position if specified, skipping the warp when the
+        # cursor was already sent there (cache reset on start/retarget)
+        target = self._target_position
+        if target and target != self._last_set_position:
+            self._mouse.position = target
+            self._last_set_position = target
         
         # Click
-        self._mouse.click(button)
+        self._backend.click(self._button, target)
         
-        with self._lock:
-            self._click_count += 1
+        count = next(self._counter)
+        self._click_count = count
         
         # Notify callback
         if self._on_click_callback:
             try:
-                self._on_click_callback(self._click_count)
-            except Exception as e:
-                print(f"Error in click callback: {e}")
+                self._on_click_callback(count)
+            except Exception:
+                logger.exception("Error in click callback")
     
     def _click_loop(self) -> None:
         """Main clicking loop running in background thread"""
-        while self._clicking:
-            if self._config.pattern == ClickPattern.BURST:
-                # Burst mode: rapid clicks followed by pause
-                for _ in range(self._config.burst_clicks):
-                    if not self._clicking:
-                        break
-                    self._perform_click()
-                    time.sleep(0.05)  # Rapid 50ms between burst clicks
-                
-                if self._clicking:
-                    time.sleep(self._config.burst_pause_ms / 1000.0)
-            else:
-                # Normal click
-                self._perform_click()
-                interval = self._calculate_interval()
-                
-                # Sleep in small increments to allow quick stopping
-                sleep_remaining = interval
-                while sleep_remaining > 0 and self._clicking:
-                    sleep_time = min(0.05, sleep_remaining)
-                    time.sleep(sleep_time)
-                    sleep_remaining -= sleep_time
+        # Schedule against absolute monotonic deadlines so the time spent
+        # performing a click does not accumulate as drift
+        next_deadline = time.monotonic()
+        
+        # Run the loop specialized for the current pattern; it returns when
+        # stopped or when settings it hoisted into locals have changed.
+        # Each loop binds hot attributes and methods to locals up front.
+        while not self._stop_event.is_set():
+            self._settings_changed = False
+            next_deadline = self._loop_fn(next_deadline)
+    
+    def _loop_constant(self, next_deadline: float) -> float:
+        """Click loop for CONSTANT pattern"""
+        interval = self._base_interval_s
+        perform = self._perform_click
+        wait_until = self._wait_until
+        reanchor = self._reanchor
+        
+        while not self._settings_changed:
+            next_deadline = reanchor(next_deadline)
+            perform()
+            next_deadline += interval
+            if wait_until(next_deadline):
+                break
+        return next_deadline
+    
+    def _loop_random(self, next_deadline: float) -> float:
+        """Click loop for RANDOM pattern"""
+        base = self._base_interval_s
+        variance = self._variance_s
+        uniform = self._rng.uniform
+        perform = self._perform_click
+        wait_until = self._wait_until
+        reanchor = self._reanchor
+        
+        while not self._settings_changed:
+            next_deadline = reanchor(next_deadline)
+            perform()
+            next_deadline += base + uniform(-variance, variance)
+            if wait_until(next_deadline):
+                break
+        return next_deadline
+    
+    def _loop_burst(self, next_deadline: float) -> float:
+        """Click loop for BURST pattern: rapid clicks followed by a pause"""
+        burst_clicks = range(self._config.burst_clicks)
+        burst_gap = self.BURST_GAP_S
+        burst_pause = self._burst_pause_s
+        perform = self._perform_click
+        wait_until = self._wait_until
+        reanchor = self._reanchor
+        
+        while not self._settings_changed:
+            next_deadline = reanchor(next_deadline)
+            for _ in burst_clicks:
+                perform()
+                next_deadline += burst_gap
+                if wait_until(next_deadline):
+                    return next_deadline
+            
+            next_deadline += burst_pause
+            if wait_until(next_deadline):
+                break
+        return next_deadline
+    
+    def _reanchor(self, deadline: float) -> float:
+        """
+        Re-anchor the schedule after a long stall (e.g. system suspend)
+        instead of firing a catch-up flood of clicks.
+        """
+        now = time.monotonic()
+        if now - deadline > self.MAX_SCHEDULE_LAG_S:
+            return now
+        return deadline
+    
+    def _wait_until(self, deadline: float) -> bool:
+        """
+        Wait until the given monotonic deadline or until stopped.
+        
+        Returns:
+            True if clicking was stopped while waiting
+        """
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            return self._stop_event.wait(timeout=remaining)
+        return self._stop_event.is_set()
     
     def reset_stats(self) -> None:
         """Reset click count and runtime"""
-        with self._lock:
-            self._click_count = 0
-            self._start_time = time.time() if self._clicking else None
+        self._counter = itertools.count(1)
+        self._click_count = 0
+        self._start_time = time.time() if self.is_clicking else None
 
 
 # Preset configurations
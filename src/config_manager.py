@@ -3,12 +3,40 @@ Configuration Manager Module
 Handles loading, saving, and validating user configuration.
 """
 
+import atexit
 import json
+import logging
 import os
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Validation limits
+MIN_INTERVAL_MS = 50
+MAX_INTERVAL_MS = 10000
+VALID_PATTERNS = ["constant", "random", "burst"]
+VALID_BUTTONS = ["left", "right", "middle"]
+
+# Saves run on the debounce timer thread, the GUI thread and from other
+# manager instances; they all share one temp file, so serialise them
+_SAVE_LOCK = threading.Lock()
+
+# Managers with a debounced save outstanding, flushed once at exit
+_PENDING_SAVES: set = set()
+
+
+def _flush_pending_saves() -> None:
+    """Write out every pending debounced save before the process exits"""
+    for manager in tuple(_PENDING_SAVES):
+        manager.flush()
+
+
+# Don't lose a debounced change if the app exits before it fires
+atexit.register(_flush_pending_saves)
+
 
 @dataclass
 class Configuration:
@@ -23,6 +51,19 @@ class Configuration:
     start_minimized: bool = False
     auto_start: bool = False
     max_runtime_minutes: int = 0         # 0 = unlimited
+    
+    def __post_init__(self):
+        """Clamp or reset out-of-range values in a single pass"""
+        self.click_interval_ms = max(
+            MIN_INTERVAL_MS,
+            min(MAX_INTERVAL_MS, self.click_interval_ms)
+        )
+        if self.intensity_pattern not in VALID_PATTERNS:
+            self.intensity_pattern = "constant"
+        if self.mouse_button not in VALID_BUTTONS:
+            self.mouse_button = "left"
+        if self.max_runtime_minutes < 0:
+            self.max_runtime_minutes = 0
 
 
 class ConfigurationManager:
@@ -32,10 +73,13 @@ class ConfigurationManager:
     """
     
     # Validation limits
-    MIN_INTERVAL_MS = 50
-    MAX_INTERVAL_MS = 10000
-    VALID_PATTERNS = ["constant", "random", "burst"]
-    VALID_BUTTONS = ["left", "right", "middle"]
+    MIN_INTERVAL_MS = MIN_INTERVAL_MS
+    MAX_INTERVAL_MS = MAX_INTERVAL_MS
+    VALID_PATTERNS = VALID_PATTERNS
+    VALID_BUTTONS = VALID_BUTTONS
+    
+    # Setter changes within this window are coalesced into one write
+    SAVE_DEBOUNCE_S = 0.5
     
     def __init__(self, config_dir: Optional[str] = None):
         """
@@ -51,6 +95,9 @@ class ConfigurationManager:
         
         self._config_file = self._config_dir / "config.json"
         self._config: Configuration = self.get_default_config()
+        self._dir_exists = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
     
     def load_config(self) -> Configuration:
         """
@@ -69,7 +116,7 @@ class ConfigurationManager:
                         data = json.load(f)
                         self._config = Configuration(**data)
                 except (json.JSONDecodeError, TypeError) as e:
-                    print(f"Error loading default config: {e}")
+                    logger.error("Error loading default config: %s", e)
                     self._config = self.get_default_config()
             else:
                 self._config = self.get_default_config()
@@ -81,16 +128,16 @@ class ConfigurationManager:
         try:
             with open(self._config_file, 'r') as f:
                 data = json.load(f)
-                self._config = Configuration(**data)
-                
-                # Validate and fix if needed
-                if not self.validate_config(self._config):
-                    self._config = self._fix_invalid_config(self._config)
-                    self.save_config(self._config)
-                
-                return self._config
+            
+            # Configuration normalizes itself; only rewrite the file when
+            # that changed something (or filled in missing fields)
+            self._config = Configuration(**data)
+            if vars(self._config) != data:
+                self.save_config(self._config)
+            
+            return self._config
         except (json.JSONDecodeError, TypeError, FileNotFoundError) as e:
-            print(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
             self._config = self.get_default_config()
             return self._config
     
@@ -104,18 +151,73 @@ class ConfigurationManager:
         Returns:
             True if saved successfully
         """
-        try:
-            # Ensure directory exists
-            self._config_dir.mkdir(parents=True, exist_ok=True)
-            
-            with open(self._config_file, 'w') as f:
-                json.dump(asdict(config), f, indent=4)
-            
-            self._config = config
+        # A full save supersedes any pending debounced save
+        self._cancel_pending_save()
+        
+        tmp_file = self._config_file.with_suffix(".json.tmp")
+        with _SAVE_LOCK:
+            try:
+                # Ensure directory exists
+                if not self._dir_exists:
+                    self._config_dir.mkdir(parents=True, exist_ok=True)
+                    self._dir_exists = True
+                
+                # Write to a temp file and rename it over the real one so a crash
+                # mid-write can never leave a truncated config behind
+                with open(tmp_file, 'w') as f:
+                    # Fields are flat primitives, so skip asdict()'s deep copy
+                    json.dump(vars(config), f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self._config_file)
+                
+                self._config = config
+                return True
+            except (OSError, IOError) as e:
+                logger.error("Error saving config: %s", e)
+                self._dir_exists = False
+                try:
+                    tmp_file.unlink(missing_ok=True)
+                except OSError:
+                    pass
+                return False
+    
+    def flush(self) -> bool:
+        """
+        Write any pending debounced changes to disk immediately.
+        
+        Returns:
+            True if nothing was pending or the save succeeded
+        """
+        if not self._cancel_pending_save():
             return True
-        except (OSError, IOError) as e:
-            print(f"Error saving config: {e}")
+        return self.save_config(self._config)
+    
+    def _schedule_save(self) -> None:
+        """Save the current config after SAVE_DEBOUNCE_S of no further changes"""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_S, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            _PENDING_SAVES.add(self)
+    
+    def _cancel_pending_save(self) -> bool:
+        """
+        Cancel the pending debounced save, if any.
+        
+        Returns:
+            True if a save was pending
+        """
+        with self._save_lock:
+            timer = self._save_timer
+            self._save_timer = None
+            _PENDING_SAVES.discard(self)
+        if timer is None:
             return False
+        timer.cancel()
+        return True
     
     def get_default_config(self) -> Configuration:
         """Get default configuration"""
@@ -149,52 +251,35 @@ class ConfigurationManager:
         
         return True
     
-    def _fix_invalid_config(self, config: Configuration) -> Configuration:
-        """Fix invalid configuration values"""
-        # Fix interval
-        config.click_interval_ms = max(
-            self.MIN_INTERVAL_MS,
-            min(self.MAX_INTERVAL_MS, config.click_interval_ms)
-        )
-        
-        # Fix pattern
-        if config.intensity_pattern not in self.VALID_PATTERNS:
-            config.intensity_pattern = "constant"
-        
-        # Fix mouse button
-        if config.mouse_button not in self.VALID_BUTTONS:
-            config.mouse_button = "left"
-        
-        # Fix max runtime
-        if config.max_runtime_minutes < 0:
-            config.max_runtime_minutes = 0
-        
-        return config
-    
     @property
     def current_config(self) -> Configuration:
         """Get the current configuration"""
         return self._config
     
+    @property
+    def config_file(self) -> Path:
+        """Get the path of the user config file"""
+        return self._config_file
+    
     def update_interval(self, interval_ms: int) -> None:
-        """Update and save click interval"""
+        """Update click interval and schedule a debounced save"""
         self._config.click_interval_ms = max(
             self.MIN_INTERVAL_MS,
             min(self.MAX_INTERVAL_MS, interval_ms)
         )
-        self.save_config(self._config)
+        self._schedule_save()
     
     def update_pattern(self, pattern: str) -> None:
-        """Update and save intensity pattern"""
+        """Update intensity pattern and schedule a debounced save"""
         if pattern in self.VALID_PATTERNS:
             self._config.intensity_pattern = pattern
-            self.save_config(self._config)
+            self._schedule_save()
     
     def update_mouse_button(self, button: str) -> None:
-        """Update and save mouse button"""
+        """Update mouse button and schedule a debounced save"""
         if button in self.VALID_BUTTONS:
             self._config.mouse_button = button
-            self.save_config(self._config)
+            self._schedule_save()
 
 
 # For testing
@@ -3,21 +3,65 @@ Hotkey Manager Module
 Handles global keyboard shortcuts for controlling the auto-clicker.
 """
 
+import logging
 import threading
-from typing import Dict, Callable, Optional, Set
+from typing import Dict, Callable, Optional, Tuple
 from pynput import keyboard
 
+logger = logging.getLogger(__name__)
+
 
 class HotkeyManager:
     """
     Manages global hotkeys for the application.
-    Uses pynput for cross-platform keyboard monitoring.
+    Uses pynput's GlobalHotKeys for cross-platform keyboard monitoring.
     """
     
+    # User-facing key names -> pynput hotkey tokens
+    KEY_TOKENS = {
+        # Modifiers
+        "ctrl": "<ctrl>",
+        "control": "<ctrl>",
+        "shift": "<shift>",
+        "alt": "<alt>",
+        "cmd": "<cmd>",
+        "command": "<cmd>",
+        # Special keys
+        "escape": "<esc>",
+        "esc": "<esc>",
+        "space": "<space>",
+        "enter": "<enter>",
+        "return": "<enter>",
+        "tab": "<tab>",
+        "backspace": "<backspace>",
+        "delete": "<delete>",
+        "home": "<home>",
+        "end": "<end>",
+        "pageup": "<page_up>",
+        "pagedown": "<page_down>",
+        "up": "<up>",
+        "down": "<down>",
+        "left": "<left>",
+        "right": "<right>",
+        # Function keys
+        "f1": "<f1>",
+        "f2": "<f2>",
+        "f3": "<f3>",
+        "f4": "<f4>",
+        "f5": "<f5>",
+        "f6": "<f6>",
+        "f7": "<f7>",
+        "f8": "<f8>",
+        "f9": "<f9>",
+        "f10": "<f10>",
+        "f11": "<f11>",
+        "f12": "<f12>",
+    }
+    
     def __init__(self):
-        self._hotkeys: Dict[frozenset, Callable] = {}  # key_set -> callback
-        self._pressed_keys: Set[keyboard.Key | keyboard.KeyCode] = set()
-        self._listener: Optional[keyboard.Listener] = None
+        # key_set -> (pynput hotkey string, callback)
+        self._hotkeys: Dict[frozenset, Tuple[str, Callable]] = {}
+        self._listener: Optional[keyboard.GlobalHotKeys] = None
         self._running = False
         self._lock = threading.Lock()
     
@@ -27,19 +71,12 @@ class HotkeyManager:
             return
         
         self._running = True
-        self._listener = keyboard.Listener(
-            on_press=self._on_key_press,
-            on_release=self._on_key_release
-        )
-        self._listener.start()
+        self._start_listener()
     
     def stop(self) -> None:
         """Stop listening for hotkeys"""
         self._running = False
-        if self._listener:
-            self._listener.stop()
-            self._listener = None
-        self._pressed_keys.clear()
+        self._stop_listener()
     
     def register_hotkey(self, key_combination: str, callback: Callable) -> bool:
         """
@@ -53,12 +90,13 @@ class HotkeyManager:
             True if registered successfully
         """
         try:
-            key_set = self._parse_key_combination(key_combination)
+            hotkey, key_set = self._parse_key_combination(key_combination)
             with self._lock:
-                self._hotkeys[key_set] = callback
+                self._hotkeys[key_set] = (hotkey, callback)
+            self._restart_listener()
             return True
         except ValueError as e:
-            print(f"Error registering hotkey '{key_combination}': {e}")
+            logger.error("Error registering hotkey '%s': %s", key_combination, e)
             return False
     
     def unregister_hotkey(self, key_combination: str) -> bool:
@@ -72,12 +110,13 @@ class HotkeyManager:
             True if unregistered successfully
         """
         try:
-            key_set = self._parse_key_combination(key_combination)
+            _, key_set = self._parse_key_combination(key_combination)
             with self._lock:
-                if key_set in self._hotkeys:
-                    del self._hotkeys[key_set]
-                    return True
-            return False
+                if key_set not in self._hotkeys:
+                    return False
+                del self._hotkeys[key_set]
+            self._restart_listener()
+            return True
         except ValueError:
             return False
     
@@ -92,109 +131,69 @@ class HotkeyManager:
             True if the hotkey is not already registered
         """
         try:
-            key_set = self._parse_key_combination(key_combination)
+            _, key_set = self._parse_key_combination(key_combination)
             with self._lock:
                 return key_set not in self._hotkeys
         except ValueError:
             return False
     
-    def _parse_key_combination(self, combo: str) -> frozenset:
+    def _parse_key_combination(self, combo: str) -> Tuple[str, frozenset]:
         """
-        Parse a key combination string into a set of keys.
+        Translate a key combination string into pynput hotkey form.
         
         Args:
             combo: Key combo like "ctrl+shift+s"
             
         Returns:
-            Frozenset of pynput Key/KeyCode objects
+            Tuple of (pynput hotkey string like "<ctrl>+<shift>+s",
+            order-independent frozenset of its keys)
         """
-        keys = set()
+        tokens = []
         parts = combo.lower().replace(" ", "").split("+")
         
-        key_mapping = {
-            # Modifiers
-            "ctrl": keyboard.Key.ctrl_l,
-            "control": keyboard.Key.ctrl_l,
-            "shift": keyboard.Key.shift,
-            "alt": keyboard.Key.alt_l,
-            "cmd": keyboard.Key.cmd,
-            "command": keyboard.Key.cmd,
-            # Special keys
-            "escape": keyboard.Key.esc,
-            "esc": keyboard.Key.esc,
-            "space": keyboard.Key.space,
-            "enter": keyboard.Key.enter,
-            "return": keyboard.Key.enter,
-            "tab": keyboard.Key.tab,
-            "backspace": keyboard.Key.backspace,
-            "delete": keyboard.Key.delete,
-            "home": keyboard.Key.home,
-            "end": keyboard.Key.end,
-            "pageup": keyboard.Key.page_up,
-            "pagedown": keyboard.Key.page_down,
-            "up": keyboard.Key.up,
-            "down": keyboard.Key.down,
-            "left": keyboard.Key.left,
-            "right": keyboard.Key.right,
-            # Function keys
-            "f1": keyboard.Key.f1,
-            "f2": keyboard.Key.f2,
-            "f3": keyboard.Key.f3,
-            "f4": keyboard.Key.f4,
-            "f5": keyboard.Key.f5,
-            "f6": keyboard.Key.f6,
-            "f7": keyboard.Key.f7,
-            "f8": keyboard.Key.f8,
-            "f9": keyboard.Key.f9,
-            "f10": keyboard.Key.f10,
-            "f11": keyboard.Key.f11,
-            "f12": keyboard.Key.f12,
-        }
-        
         for part in parts:
-            if part in key_mapping:
-                keys.add(key_mapping[part])
+            if part in self.KEY_TOKENS:
+                tokens.append(self.KEY_TOKENS[part])
             elif len(part) == 1:
-                keys.add(keyboard.KeyCode.from_char(part))
+                tokens.append(part)
             else:
                 raise ValueError(f"Unknown key: {part}")
         
-        return frozenset(keys)
-    
-    def _normalize_key(self, key) -> keyboard.Key | keyboard.KeyCode:
-        """Normalize key to handle left/right variants"""
-        # Map right-side modifiers to left-side
-        key_mapping = {
-            keyboard.Key.ctrl_r: keyboard.Key.ctrl_l,
-            keyboard.Key.shift_r: keyboard.Key.shift,
-            keyboard.Key.alt_r: keyboard.Key.alt_l,
-            keyboard.Key.cmd_r: keyboard.Key.cmd,
-        }
-        
-        if hasattr(key, 'name'):
-            return key_mapping.get(key, key)
-        return key
-    
-    def _on_key_press(self, key) -> None:
-        """Handle key press events"""
-        normalized = self._normalize_key(key)
-        self._pressed_keys.add(normalized)
-        
-        # Check if any registered hotkey matches
-        current_keys = frozenset(self._pressed_keys)
+        hotkey = "+".join(tokens)
+        # HotKey.parse raises ValueError for malformed combinations
+        return hotkey, frozenset(keyboard.HotKey.parse(hotkey))
+    
+    def _start_listener(self) -> None:
+        """Build a GlobalHotKeys listener for the current bindings and start it"""
         with self._lock:
-            for hotkey_set, callback in self._hotkeys.items():
-                if hotkey_set == current_keys:
-                    try:
-                        callback()
-                    except Exception as e:
-                        print(f"Error in hotkey callback: {e}")
-                    break
-    
-    def _on_key_release(self, key) -> None:
-        """Handle key release events"""
-        normalized = self._normalize_key(key)
-        self._pressed_keys.discard(normalized)
+            mapping = {
+                hotkey: self._wrap_callback(callback)
+                for hotkey, callback in self._hotkeys.values()
+            }
+        self._listener = keyboard.GlobalHotKeys(mapping)
+        self._listener.start()
+    
+    def _stop_listener(self) -> None:
+        """Stop the active GlobalHotKeys listener, if any"""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+    
+    def _restart_listener(self) -> None:
+        """Apply changed bindings; GlobalHotKeys can't be updated in place"""
+        if self._running:
+            self._stop_listener()
+            self._start_listener()
+    
+    @staticmethod
+    def _wrap_callback(callback: Callable) -> Callable[[], None]:
+        """Guard a callback so an exception can't kill the listener thread"""
+        def run() -> None:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error in hotkey callback")
+        return run
 
 
 # For testing
@@ -2,23 +2,100 @@
 The Forge Auto-Clicker - Main Entry Point
 """
 
+import argparse
+import json
+import logging
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
 
-from ui.main_window import MainWindow
+APP_NAME = "The Forge Auto-Clicker"
+APP_VERSION = "1.0.0"
+
+
+def parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    """
+    Parse command line arguments.
+    
+    Returns:
+        Tuple of (parsed args, remaining args to hand to Qt)
+    """
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {APP_VERSION}"
+    )
+    parser.add_argument(
+        "--validate-config",
+        action="store_true",
+        help="check the user config file and exit"
+    )
+    return parser.parse_known_args(argv)
+
+
+def validate_config() -> int:
+    """
+    Check the user config file without starting the GUI or modifying it.
+    
+    Returns:
+        Process exit code (0 if the file is valid)
+    """
+    from config_manager import ConfigurationManager, Configuration
+    
+    path = ConfigurationManager().config_file
+    if not path.exists():
+        print(f"{path}: not found (defaults will be used)")
+        return 0
+    
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        config = Configuration(**data)
+    except (json.JSONDecodeError, TypeError) as e:
+        print(f"{path}: invalid: {e}")
+        return 1
+    
+    problems = [
+        f"{key}: {data.get(key)!r} -> {value!r}"
+        for key, value in vars(config).items()
+        if data.get(key) != value
+    ]
+    if problems:
+        print(f"{path}: values will be corrected on load:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    
+    print(f"{path}: OK")
+    return 0
 
 
 def main():
     """Application entry point"""
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
+    
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.validate_config:
+        sys.exit(validate_config())
+    
+    # Qt is only imported once we know the GUI is needed
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    from ui.main_window import MainWindow
+    from ui.theme import APP_STYLESHEET, build_palette
+    
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
-    app = QApplication(sys.argv)
-    app.setApplicationName("The Forge Auto-Clicker")
-    app.setApplicationVersion("1.0.0")
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setApplicationName(APP_NAME)
+    app.setApplicationVersion(APP_VERSION)
+    app.setPalette(build_palette())
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Create and show main window
     window = MainWindow()
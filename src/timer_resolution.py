@@ -0,0 +1,49 @@
+"""
+Timer Resolution Module
+Requests a 1ms system timer resolution on Windows while clicking is active.
+"""
+
+import logging
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Windows defaults to a ~15.6ms scheduler tick, which makes sleeps and waits
+# overshoot short click intervals. Other platforms already have fine-grained
+# timers, so every function here is a no-op outside of Windows.
+_PERIOD_MS = 1
+
+_lock = threading.Lock()
+_refcount = 0
+_winmm = None
+
+if sys.platform == "win32":
+    try:
+        import ctypes
+        _winmm = ctypes.WinDLL("winmm")
+    except OSError as e:
+        logger.warning("winmm unavailable, timer resolution unchanged: %s", e)
+
+
+def begin_high_resolution() -> None:
+    """
+    Request high timer resolution.
+    Calls are reference-counted; each must be paired with end_high_resolution().
+    """
+    global _refcount
+    with _lock:
+        _refcount += 1
+        if _refcount == 1 and _winmm is not None:
+            _winmm.timeBeginPeriod(_PERIOD_MS)
+
+
+def end_high_resolution() -> None:
+    """Release a high timer resolution request made by begin_high_resolution()"""
+    global _refcount
+    with _lock:
+        if _refcount == 0:
+            return
+        _refcount -= 1
+        if _refcount == 0 and _winmm is not None:
+            _winmm.timeEndPeriod(_PERIOD_MS)
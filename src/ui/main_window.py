@@ -3,25 +3,85 @@ Main Window UI
 The primary application window with auto-clicker controls.
 """
 
+from functools import lru_cache, partial
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSpinBox, QRadioButton, QButtonGroup,
-    QGroupBox, QFrame, QMessageBox, QStatusBar, QComboBox
+    QGroupBox, QMessageBox, QStatusBar, QComboBox
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
+from PyQt6.QtGui import QFont
 
 from window_detector import WindowDetector
 from click_generator import ClickGenerator, ClickPattern
-from config_manager import ConfigurationManager, Configuration
+from config_manager import ConfigurationManager
 from hotkey_manager import HotkeyManager
 
+# Enum values are plain constants, so resolve them once at import
+_WINDOW_FLAGS = (
+    Qt.WindowType.Window |
+    Qt.WindowType.WindowCloseButtonHint |
+    Qt.WindowType.WindowMinimizeButtonHint
+)
+_BOLD = QFont.Weight.Bold
+
+
+@lru_cache(maxsize=None)
+def _ui_font(size: int, bold: bool = False) -> QFont:
+    """
+    Get a shared UI font.
+    Built on first use rather than at import, since a QFont needs a
+    QApplication to resolve against.
+    """
+    if bold:
+        return QFont("Segoe UI", size, _BOLD)
+    return QFont("Segoe UI", size)
+
+
+# Static dialog text
+_ABOUT_HTML = (
+    "<h3>The Forge Auto-Clicker v1.0</h3>"
+    "<p>A cross-platform automated clicking utility for "
+    "\"The Forge\" Roblox game.</p>"
+    "<p><b>⚠️ Disclaimer:</b> This tool may violate Roblox's "
+    "Terms of Service. Use at your own risk.</p>"
+    "<p><b>Hotkeys:</b></p>"
+    "<ul>"
+    "<li>Ctrl+Shift+S: Toggle clicking</li>"
+    "<li>Escape: Emergency stop</li>"
+    "</ul>"
+)
+
+_CONFIRM_START_TEXT = (
+    "Are you sure you want to start auto-clicking?\n\n"
+    "⚠️ This may violate Roblox Terms of Service."
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
-    # Signal for thread-safe UI updates
-    click_updated = pyqtSignal(int)
+    # Emitted from the window detector's watcher thread; queued onto the
+    # GUI thread by Qt
+    windows_changed = pyqtSignal()
+    
+    # Window detection: bursts of window events are coalesced, and the
+    # timer is only a safety net while change events are available
+    WINDOW_EVENT_THROTTLE_MS = 250
+    WINDOW_POLL_INTERVAL_MS = 5000
+    WINDOW_FALLBACK_INTERVAL_MS = 30000
+    
+    # Statistics refresh rates; the runtime label only changes once a second
+    STATS_INTERVAL_IDLE_MS = 1000
+    STATS_INTERVAL_ACTIVE_MS = 250
+    
+    # Pattern radio button id -> (click pattern, config name)
+    _PATTERNS = (
+        (ClickPattern.CONSTANT, "constant"),
+        (ClickPattern.RANDOM, "random"),
+        (ClickPattern.BURST, "burst"),
+    )
     
     def __init__(self):
         super().__init__()
@@ -38,6 +98,10 @@ class MainWindow(QMainWindow):
         # State
         self._is_clicking = False
         self._start_time = None
+        self._last_runtime = None  # last (h, m, s) shown in the runtime label
+        self._last_rendered_clicks = 0
+        self._settings_dialog = None  # built on first open, then reused
+        self._confirm_box = None  # likewise for the start confirmation
         
         # Setup UI
         self._setup_window()
@@ -48,18 +112,16 @@ class MainWindow(QMainWindow):
         self._setup_timers()
         self._setup_hotkeys()
         
-        # Initial window detection - populate dropdown
-        self._refresh_windows()
+        # Initial window detection - populate dropdown once the event loop
+        # is running, so enumerating windows doesn't delay the first paint
+        # (the status label reads "Searching..." until then)
+        QTimer.singleShot(0, self._refresh_windows)
     
     def _setup_window(self):
         """Configure main window properties"""
         self.setWindowTitle("The Forge Auto-Clicker")
         self.setFixedSize(420, 520)
-        self.setWindowFlags(
-            Qt.WindowType.Window |
-            Qt.WindowType.WindowCloseButtonHint |
-            Qt.WindowType.WindowMinimizeButtonHint
-        )
+        self.setWindowFlags(_WINDOW_FLAGS)
     
     def _create_widgets(self):
         """Create all UI widgets"""
@@ -70,9 +132,9 @@ class MainWindow(QMainWindow):
         # ===== Target Window Section =====
         self._window_group = QGroupBox("Target Window")
         self._window_status_indicator = QLabel("●")
-        self._window_status_indicator.setFont(QFont("Segoe UI", 16))
+        self._window_status_indicator.setFont(_ui_font(16))
         self._window_status_label = QLabel("Searching...")
-        self._window_status_label.setFont(QFont("Segoe UI", 10))
+        self._window_status_label.setFont(_ui_font(10))
         
         # Window selector dropdown
         self._window_selector = QComboBox()
@@ -87,7 +149,7 @@ class MainWindow(QMainWindow):
         self._interval_spin.setRange(50, 10000)
         self._interval_spin.setValue(self._config.click_interval_ms)
         self._interval_spin.setSingleStep(10)
-        self._interval_spin.setFont(QFont("Segoe UI", 12))
+        self._interval_spin.setFont(_ui_font(12))
         
         # Preset buttons
         self._slow_btn = QPushButton("Slow (500ms)")
@@ -106,13 +168,18 @@ class MainWindow(QMainWindow):
         self._pattern_button_group.addButton(self._pattern_burst, 2)
         
         # Set initial selection
-        pattern_map = {"constant": 0, "random": 1, "burst": 2}
-        initial_pattern = pattern_map.get(self._config.intensity_pattern, 0)
-        self._pattern_button_group.button(initial_pattern).setChecked(True)
+        # Tracked here so starting doesn't have to query the button group
+        self._current_pattern_id = next(
+            (i for i, (_, name) in enumerate(self._PATTERNS)
+             if name == self._config.intensity_pattern),
+            0
+        )
+        self._pattern_button_group.button(self._current_pattern_id).setChecked(True)
         
         # ===== Start/Stop Button =====
         self._toggle_btn = QPushButton("START CLICKING")
-        self._toggle_btn.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        self._toggle_btn.setObjectName("toggle")
+        self._toggle_btn.setFont(_ui_font(14, bold=True))
         self._toggle_btn.setMinimumHeight(60)
         
         # ===== Statistics Section =====
@@ -132,6 +199,10 @@ class MainWindow(QMainWindow):
     
     def _setup_layout(self):
         """Arrange widgets in layouts"""
+        # Suspend repaints while the tree is assembled; geometry is then
+        # computed once by activate() below
+        self._central.setUpdatesEnabled(False)
+        
         main_layout = QVBoxLayout(self._central)
         main_layout.setSpacing(15)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -189,107 +260,30 @@ class MainWindow(QMainWindow):
         bottom_layout.addWidget(self._settings_btn)
         bottom_layout.addWidget(self._about_btn)
         main_layout.addLayout(bottom_layout)
+        
+        main_layout.activate()
+        self._central.setUpdatesEnabled(True)
     
     def _apply_styles(self):
         """Apply visual styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a2e;
-            }
-            QGroupBox {
-                font-weight: bold;
-                color: #eee;
-                border: 2px solid #4a4a6a;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #ddd;
-            }
-            QPushButton {
-                background-color: #3a3a5a;
-                color: #fff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a7a;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a4a;
-            }
-            QPushButton#toggle_active {
-                background-color: #e74c3c;
-            }
-            QPushButton#toggle_inactive {
-                background-color: #27ae60;
-            }
-            QSpinBox {
-                background-color: #2a2a4a;
-                color: #fff;
-                border: 2px solid #4a4a6a;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                width: 20px;
-            }
-            QRadioButton {
-                color: #ddd;
-                spacing: 8px;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QStatusBar {
-                background-color: #0f0f1a;
-                color: #888;
-            }
-        """)
-        
-        # Set initial toggle button style
+        # The stylesheet itself is set on the QApplication (see ui.theme);
+        # only the toggle button's initial state is needed here
         self._update_toggle_button_style()
     
     def _update_toggle_button_style(self):
         """Update toggle button appearance based on state"""
+        # Restyle via the [state=...] selectors in APP_STYLESHEET rather than
+        # parsing a fresh stylesheet on every toggle
         if self._is_clicking:
             self._toggle_btn.setText("STOP CLICKING")
-            self._toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
+            self._toggle_btn.setProperty("state", "active")
         else:
             self._toggle_btn.setText("START CLICKING")
-            self._toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #219a52;
-                }
-            """)
+            self._toggle_btn.setProperty("state", "inactive")
+        
+        style = self._toggle_btn.style()
+        style.unpolish(self._toggle_btn)
+        style.polish(self._toggle_btn)
     
     def _update_window_status(self, connected: bool, title: str = ""):
         """Update window connection status display"""
@@ -304,42 +298,52 @@ class MainWindow(QMainWindow):
     
     def _connect_signals(self):
         """Connect widget signals to slots"""
-        self._toggle_btn.clicked.connect(self._on_toggle_clicked)
-        self._refresh_btn.clicked.connect(self._refresh_windows)
+        # All of these are emitted on the GUI thread, so skip the
+        # thread-affinity check AutoConnection makes on every emit
+        direct = Qt.ConnectionType.DirectConnection
+        
+        self._toggle_btn.clicked.connect(self._on_toggle_clicked, direct)
+        self._refresh_btn.clicked.connect(self._refresh_windows, direct)
         
         # Window selector
-        self._window_selector.currentIndexChanged.connect(self._on_window_selected)
+        self._window_selector.currentIndexChanged.connect(self._on_window_selected, direct)
         
         # Preset buttons
-        self._slow_btn.clicked.connect(lambda: self._set_interval(500))
-        self._medium_btn.clicked.connect(lambda: self._set_interval(250))
-        self._fast_btn.clicked.connect(lambda: self._set_interval(100))
+        self._slow_btn.clicked.connect(partial(self._interval_spin.setValue, 500), direct)
+        self._medium_btn.clicked.connect(partial(self._interval_spin.setValue, 250), direct)
+        self._fast_btn.clicked.connect(partial(self._interval_spin.setValue, 100), direct)
         
         # Interval change
-        self._interval_spin.valueChanged.connect(self._on_interval_changed)
+        self._interval_spin.valueChanged.connect(self._on_interval_changed, direct)
         
         # Pattern change
-        self._pattern_button_group.buttonClicked.connect(self._on_pattern_changed)
+        self._pattern_button_group.idClicked.connect(self._on_pattern_changed, direct)
         
         # Settings and About
-        self._settings_btn.clicked.connect(self._show_settings)
-        self._about_btn.clicked.connect(self._show_about)
-        
-        # Click updates (thread-safe)
-        self.click_updated.connect(self._on_click_updated)
-        self._click_generator.on_click(lambda count: self.click_updated.emit(count))
+        self._settings_btn.clicked.connect(self._show_settings, direct)
+        self._about_btn.clicked.connect(self._show_about, direct)
     
     def _setup_timers(self):
         """Setup update timers"""
         # Statistics update timer
         self._stats_timer = QTimer()
         self._stats_timer.timeout.connect(self._update_stats)
-        self._stats_timer.start(100)  # Update every 100ms
+        self._stats_timer.start(self.STATS_INTERVAL_IDLE_MS)
+        
+        # Window change events, throttled to one detection per interval
+        self._window_event_timer = QTimer()
+        self._window_event_timer.setSingleShot(True)
+        self._window_event_timer.setInterval(self.WINDOW_EVENT_THROTTLE_MS)
+        self._window_event_timer.timeout.connect(self._detect_window)
+        self.windows_changed.connect(self._on_windows_changed)
         
-        # Window detection timer
+        # Window detection timer; only polls often if events are unsupported
         self._window_timer = QTimer()
         self._window_timer.timeout.connect(self._detect_window)
-        self._window_timer.start(5000)  # Check every 5 seconds
+        if self._window_detector.subscribe_changes(self.windows_changed.emit):
+            self._window_timer.start(self.WINDOW_FALLBACK_INTERVAL_MS)
+        else:
+            self._window_timer.start(self.WINDOW_POLL_INTERVAL_MS)
     
     def _setup_hotkeys(self):
         """Setup global hotkeys"""
@@ -408,6 +412,13 @@ class MainWindow(QMainWindow):
         """Detect window based on current selector state"""
         self._on_window_selected()
     
+    def _on_windows_changed(self):
+        """Schedule a detection for a burst of window events"""
+        # Leading-edge: restarting the timer per event would let constantly
+        # changing titles postpone detection indefinitely
+        if not self._window_event_timer.isActive():
+            self._window_event_timer.start()
+    
     def _on_toggle_clicked(self):
         """Handle start/stop toggle"""
         if self._is_clicking:
@@ -419,30 +430,27 @@ class MainWindow(QMainWindow):
         """Start auto-clicking"""
         # Check for confirmation
         if self._config.confirm_before_start:
-            reply = QMessageBox.question(
-                self,
-                "Start Auto-Clicking?",
-                "Are you sure you want to start auto-clicking?\n\n"
-                "⚠️ This may violate Roblox Terms of Service.",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-            if reply != QMessageBox.StandardButton.Yes:
+            if self._confirm_box is None:
+                self._confirm_box = QMessageBox(self)
+                self._confirm_box.setIcon(QMessageBox.Icon.Question)
+                self._confirm_box.setWindowTitle("Start Auto-Clicking?")
+                self._confirm_box.setText(_CONFIRM_START_TEXT)
+                self._confirm_box.setStandardButtons(
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
+            # exec() leaves the last choice focused, so reset the default
+            self._confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+            # exec() returns a plain int in PyQt6, so ask which button it was
+            self._confirm_box.exec()
+            choice = self._confirm_box.standardButton(self._confirm_box.clickedButton())
+            if choice != QMessageBox.StandardButton.Yes:
                 return
         
         # Get target position from Roblox window
         target_pos = self._window_detector.get_click_position()
         
         # Get current pattern
-        pattern_map = {
-            0: ClickPattern.CONSTANT,
-            1: ClickPattern.RANDOM,
-            2: ClickPattern.BURST
-        }
-        pattern = pattern_map.get(
-            self._pattern_button_group.checkedId(),
-            ClickPattern.CONSTANT
-        )
+        pattern = self._PATTERNS[self._current_pattern_id][0]
         
         # Start clicking
         self._click_generator.start_clicking(
@@ -468,69 +476,71 @@ class MainWindow(QMainWindow):
             self._stop_clicking()
             self._status_bar.showMessage("Emergency stop activated!")
     
-    def _set_interval(self, value: int):
-        """Set interval from preset button"""
-        self._interval_spin.setValue(value)
-    
     def _on_interval_changed(self, value: int):
         """Handle interval change"""
         self._click_generator.set_interval(value)
-        self._config.click_interval_ms = value
-        self._config_manager.save_config(self._config)
+        # Debounced: holding a spinbox arrow writes the file once
+        self._config_manager.update_interval(value)
         self._interval_display.setText(f"Current Interval: {value}ms")
     
-    def _on_pattern_changed(self, button):
+    def _on_pattern_changed(self, button_id: int):
         """Handle pattern change"""
-        pattern_map = {
-            0: (ClickPattern.CONSTANT, "constant"),
-            1: (ClickPattern.RANDOM, "random"),
-            2: (ClickPattern.BURST, "burst")
-        }
-        button_id = self._pattern_button_group.id(button)
-        if button_id in pattern_map:
-            pattern, name = pattern_map[button_id]
+        if 0 <= button_id < len(self._PATTERNS):
+            self._current_pattern_id = button_id
+            pattern, name = self._PATTERNS[button_id]
             self._click_generator.set_pattern(pattern)
-            self._config.intensity_pattern = name
-            self._config_manager.save_config(self._config)
+            self._config_manager.update_pattern(name)
     
-    def _on_click_updated(self, count: int):
-        """Update click count (called from signal)"""
-        self._clicks_label.setText(f"Total Clicks: {count:,}")
+    def _update_click_count(self):
+        """Render the click count if it changed since the last tick"""
+        # Polled from the generator rather than pushed by a per-click
+        # callback; reading an int it assigns is safe under the GIL
+        count = self._click_generator.get_click_count()
+        if count != self._last_rendered_clicks:
+            self._last_rendered_clicks = count
+            self._clicks_label.setText(f"Total Clicks: {count:,}")
     
     def _update_stats(self):
         """Update statistics display"""
-        if self._is_clicking:
-            runtime = self._click_generator.get_runtime_seconds()
-            hours = int(runtime // 3600)
-            minutes = int((runtime % 3600) // 60)
-            seconds = int(runtime % 60)
-            self._runtime_label.setText(f"Active Time: {hours:02d}:{minutes:02d}:{seconds:02d}")
+        self._update_click_count()
+        
+        # The timer adjusts its own rate here rather than in start/stop,
+        # which can be reached from the hotkey listener thread
+        if not self._is_clicking:
+            if self._stats_timer.interval() != self.STATS_INTERVAL_IDLE_MS:
+                self._stats_timer.setInterval(self.STATS_INTERVAL_IDLE_MS)
+            return
+        
+        if self._stats_timer.interval() != self.STATS_INTERVAL_ACTIVE_MS:
+            self._stats_timer.setInterval(self.STATS_INTERVAL_ACTIVE_MS)
+        
+        runtime = self._click_generator.get_runtime_seconds()
+        hours = int(runtime // 3600)
+        minutes = int((runtime % 3600) // 60)
+        seconds = int(runtime % 60)
+        
+        # Skip setText (and the relayout it triggers) when nothing changed
+        if (hours, minutes, seconds) == self._last_runtime:
+            return
+        self._last_runtime = (hours, minutes, seconds)
+        self._runtime_label.setText(f"Active Time: {hours:02d}:{minutes:02d}:{seconds:02d}")
     
     def _show_settings(self):
         """Show settings dialog"""
-        from ui.settings_dialog import SettingsDialog
-        dialog = SettingsDialog(self._config, self)
-        if dialog.exec():
+        if self._settings_dialog is None:
+            from ui.settings_dialog import SettingsDialog
+            self._settings_dialog = SettingsDialog(self._config, self._config_manager, self)
+        else:
+            self._settings_dialog.set_config(self._config)
+        
+        if self._settings_dialog.exec():
             # Reload config
             self._config = self._config_manager.load_config()
             self._setup_hotkeys()
     
     def _show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self,
-            "About The Forge Auto-Clicker",
-            "<h3>The Forge Auto-Clicker v1.0</h3>"
-            "<p>A cross-platform automated clicking utility for "
-            "\"The Forge\" Roblox game.</p>"
-            "<p><b>⚠️ Disclaimer:</b> This tool may violate Roblox's "
-            "Terms of Service. Use at your own risk.</p>"
-            "<p><b>Hotkeys:</b></p>"
-            "<ul>"
-            "<li>Ctrl+Shift+S: Toggle clicking</li>"
-            "<li>Escape: Emergency stop</li>"
-            "</ul>"
-        )
+        QMessageBox.about(self, "About The Forge Auto-Clicker", _ABOUT_HTML)
     
     def closeEvent(self, event):
         """Handle window close"""
@@ -538,11 +548,16 @@ class MainWindow(QMainWindow):
         if self._is_clicking:
             self._stop_clicking()
         
-        # Stop hotkey listener
+        # Stop hotkey listener and window change events
         self._hotkey_manager.stop()
+        self._window_detector.unsubscribe_changes()
+        
+        # Write any debounced config change now
+        self._config_manager.flush()
         
         # Stop timers
         self._stats_timer.stop()
         self._window_timer.stop()
+        self._window_event_timer.stop()
         
         event.accept()
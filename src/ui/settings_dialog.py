@@ -3,29 +3,46 @@ Settings Dialog UI
 Configuration dialog for advanced settings.
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QCheckBox, QComboBox, QSpinBox,
     QPushButton, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 
 from config_manager import ConfigurationManager, Configuration
 
 
+@contextmanager
+def _signals_blocked(*widgets):
+    """Block change signals on widgets for the duration of the block"""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, blocked in zip(widgets, previous):
+            widget.blockSignals(blocked)
+
+
 class SettingsDialog(QDialog):
     """Settings configuration dialog"""
     
-    def __init__(self, config: Configuration, parent=None):
+    def __init__(self, config: Configuration, config_manager: ConfigurationManager, parent=None):
         super().__init__(parent)
         self._config = config
-        self._config_manager = ConfigurationManager()
+        # Shared with the main window, so there's one in-memory config
+        self._config_manager = config_manager
         
         self._setup_ui()
         self._load_values()
         self._connect_signals()
     
+    def set_config(self, config: Configuration):
+        """Show the given configuration, discarding any unsaved edits"""
+        self._config = config
+        self._load_values()
+    
     def _setup_ui(self):
         """Setup dialog UI"""
         self.setWindowTitle("Settings")
@@ -109,70 +126,29 @@ class SettingsDialog(QDialog):
         button_layout.addWidget(self._defaults_btn)
         
         layout.addLayout(button_layout)
-        
-        # Apply dark theme
-        self._apply_styles()
-    
-    def _apply_styles(self):
-        """Apply visual styling"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a2e;
-            }
-            QGroupBox {
-                font-weight: bold;
-                color: #eee;
-                border: 2px solid #4a4a6a;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #ddd;
-            }
-            QLineEdit, QComboBox, QSpinBox {
-                background-color: #2a2a4a;
-                color: #fff;
-                border: 2px solid #4a4a6a;
-                border-radius: 5px;
-                padding: 6px;
-            }
-            QCheckBox {
-                color: #ddd;
-                spacing: 8px;
-            }
-            QPushButton {
-                background-color: #3a3a5a;
-                color: #fff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a7a;
-            }
-        """)
     
     def _load_values(self):
         """Load current config values into widgets"""
-        self._toggle_hotkey.setText(self._config.hotkey_toggle)
-        self._stop_hotkey.setText(self._config.hotkey_emergency_stop)
-        self._pause_minimize.setChecked(self._config.pause_on_minimize)
-        self._confirm_start.setChecked(self._config.confirm_before_start)
-        self._start_minimized.setChecked(self._config.start_minimized)
-        self._auto_start.setChecked(self._config.auto_start)
-        self._max_runtime.setValue(self._config.max_runtime_minutes)
-        
-        # Mouse button
-        button_map = {"left": 0, "right": 1, "middle": 2}
-        self._mouse_button.setCurrentIndex(
-            button_map.get(self._config.mouse_button, 0)
-        )
+        # Programmatic writes shouldn't look like user edits
+        with _signals_blocked(
+            self._toggle_hotkey, self._stop_hotkey,
+            self._pause_minimize, self._confirm_start,
+            self._start_minimized, self._auto_start,
+            self._max_runtime, self._mouse_button
+        ):
+            self._toggle_hotkey.setText(self._config.hotkey_toggle)
+            self._stop_hotkey.setText(self._config.hotkey_emergency_stop)
+            self._pause_minimize.setChecked(self._config.pause_on_minimize)
+            self._confirm_start.setChecked(self._config.confirm_before_start)
+            self._start_minimized.setChecked(self._config.start_minimized)
+            self._auto_start.setChecked(self._config.auto_start)
+            self._max_runtime.setValue(self._config.max_runtime_minutes)
+            
+            # Mouse button
+            button_map = {"left": 0, "right": 1, "middle": 2}
+            self._mouse_button.setCurrentIndex(
+                button_map.get(self._config.mouse_button, 0)
+            )
     
     def _connect_signals(self):
         """Connect signals"""
@@ -0,0 +1,107 @@
+"""
+UI Theme
+Application-wide dark palette and stylesheet, applied once on the QApplication.
+"""
+
+from PyQt6.QtGui import QPalette, QColor
+
+# Plain colors go through the palette, which needs no parsing; the
+# stylesheet only keeps rules the palette can't express (borders,
+# padding, radii, per-widget overrides)
+PALETTE_COLORS = {
+    QPalette.ColorRole.Window: "#1a1a2e",
+    QPalette.ColorRole.WindowText: "#ddd",
+    QPalette.ColorRole.Base: "#2a2a4a",
+    QPalette.ColorRole.AlternateBase: "#3a3a5a",
+    QPalette.ColorRole.Text: "#fff",
+    QPalette.ColorRole.Button: "#3a3a5a",
+    QPalette.ColorRole.ButtonText: "#fff",
+}
+
+# Shared by every window and dialog; Qt parses it once at startup
+APP_STYLESHEET = """
+    QGroupBox {
+        font-weight: bold;
+        color: #eee;
+        border: 2px solid #4a4a6a;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background-color: #3a3a5a;
+        color: #fff;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #4a4a7a;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a4a;
+    }
+    QPushButton#toggle {
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        border-radius: 8px;
+    }
+    QPushButton#toggle[state="active"] {
+        background-color: #e74c3c;
+    }
+    QPushButton#toggle[state="active"]:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#toggle[state="inactive"] {
+        background-color: #27ae60;
+    }
+    QPushButton#toggle[state="inactive"]:hover {
+        background-color: #219a52;
+    }
+    QSpinBox {
+        background-color: #2a2a4a;
+        color: #fff;
+        border: 2px solid #4a4a6a;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    QSpinBox::up-button, QSpinBox::down-button {
+        width: 20px;
+    }
+    QRadioButton, QCheckBox {
+        spacing: 8px;
+    }
+    QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    QStatusBar {
+        background-color: #0f0f1a;
+        color: #888;
+    }
+    
+    /* Settings dialog inputs */
+    QDialog QLineEdit, QDialog QComboBox, QDialog QSpinBox {
+        background-color: #2a2a4a;
+        color: #fff;
+        border: 2px solid #4a4a6a;
+        border-radius: 5px;
+        padding: 6px;
+    }
+"""
+
+
+def build_palette() -> QPalette:
+    """Build the dark application palette"""
+    palette = QPalette()
+    for role, color in PALETTE_COLORS.items():
+        palette.setColor(role, QColor(color))
+    return palette
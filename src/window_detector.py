@@ -3,15 +3,57 @@ Window Detector Module
 Detects and tracks Roblox game windows, specifically "The Forge" game.
 """
 
+import logging
+import os
 import re
+import select
+import shutil
 import subprocess
+import sys
 from dataclasses import dataclass
-from typing import Optional, List, Callable
+from functools import lru_cache
+from typing import Optional, List, Callable, Dict, Tuple
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    from Xlib import X, display as xdisplay, error as xerror
+except ImportError:  # optional; window queries fall back to wmctrl/xdotool
+    xdisplay = None
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# One `wmctrl -l` line: WINDOW_ID DESKTOP HOST TITLE. Untitled windows
+# don't match; [ \t] keeps a field from running onto the next line
+_WMCTRL_LINE_RE = re.compile(r"^(\S+)[ \t]+\S+[ \t]+(\S+)[ \t]+(\S.*)$", re.MULTILINE)
+
+# One `xdotool getwindowgeometry --shell` block, in the order it prints them
+_XDOTOOL_GEOMETRY_RE = re.compile(
+    r"^WINDOW=(\d+)\nX=(-?\d+)\nY=(-?\d+)\nWIDTH=(\d+)\nHEIGHT=(\d+)$",
+    re.MULTILINE
+)
+
+
+@lru_cache(maxsize=1)
+def _check_tools() -> Tuple[bool, bool]:
+    """
+    Check whether wmctrl and xdotool are on PATH, warning about any that
+    are missing. Cached, so the lookup and warnings happen once per process.
+    
+    Returns:
+        Tuple of (wmctrl available, xdotool available)
+    """
+    have_wmctrl = shutil.which("wmctrl") is not None
+    have_xdotool = shutil.which("xdotool") is not None
+    if not have_wmctrl:
+        logger.warning("wmctrl not found. Install with: sudo apt install wmctrl")
+    if not have_xdotool:
+        logger.warning("xdotool not found. Install with: sudo apt install xdotool")
+    return have_wmctrl, have_xdotool
+
+
+@dataclass(slots=True)
 class WindowHandle:
     """Represents a window handle with metadata"""
     window_id: str
@@ -23,7 +65,7 @@ class WindowHandle:
     height: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rectangle:
     """Represents a window rectangle"""
     x: int
@@ -39,59 +81,107 @@ class Rectangle:
 class WindowDetector:
     """
     Detects and manages Roblox window references.
-    Currently supports Linux/X11 using wmctrl and xdotool.
+    Currently supports Linux/X11, querying the X server directly through
+    python-xlib when available and shelling out to wmctrl/xdotool otherwise.
     """
     
-    # Window title patterns to match Roblox and The Forge
-    ROBLOX_PATTERNS = [
-        r"Roblox",
-        r"The Forge",
-        r".*Roblox.*",
-    ]
+    # Lowercase title substrings that identify Roblox windows; any title
+    # containing "forge" ("The Forge" included) ranks above them. Plain
+    # substring tests, no regex engine on the scan
+    ROBLOX_TITLES = ("roblox",)
+    
+    # Geometry younger than this is reused instead of queried again
+    GEOMETRY_TTL_S = 0.25
+    
+    # Monitor poll interval grows by this factor each poll the state holds
+    MONITOR_BACKOFF = 1.5
     
     def __init__(self):
         self._current_window: Optional[WindowHandle] = None
+        # Last "forge" window find_roblox_window returned; nothing outranks it
+        self._last_forge_window: Optional[WindowHandle] = None
         self._state_callbacks: List[Callable[[bool], None]] = []
+        # Callbacks run here so a slow one can't delay the next poll
+        self._callback_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="window-state"
+        )
         self._monitor_thread: Optional[threading.Thread] = None
-        self._monitoring = False
-        self._check_dependencies()
+        # Set while the monitor is idle; waiting on it doubles as the poll sleep
+        self._monitor_stop = threading.Event()
+        self._monitor_stop.set()
+        self._monitor_wake = threading.Event()
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        # window_id -> (rectangle, time.monotonic() when queried)
+        self._geometry_cache: Dict[str, Tuple[Rectangle, float]] = {}
+        
+        # One long-lived X connection replaces a wmctrl/xdotool process per query
+        self._dpy = None
+        self._x_lock = threading.Lock()
+        self._connect_x11()
+        if self._dpy is None:
+            _check_tools()
     
-    def _check_dependencies(self) -> None:
-        """Check if required system tools are available"""
+    def _connect_x11(self) -> None:
+        """Open the persistent X connection used for window queries"""
+        if xdisplay is None or sys.platform == "win32":
+            return
         try:
-            subprocess.run(["wmctrl", "-l"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Warning: wmctrl not found. Install with: sudo apt install wmctrl")
+            dpy = xdisplay.Display()
+        except xerror.DisplayError as e:
+            logger.info("X11 connection unavailable, using wmctrl/xdotool: %s", e)
+            return
         
-        try:
-            subprocess.run(["xdotool", "version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Warning: xdotool not found. Install with: sudo apt install xdotool")
+        self._root = dpy.screen().root
+        self._net_client_list = dpy.intern_atom("_NET_CLIENT_LIST")
+        self._net_wm_name = dpy.intern_atom("_NET_WM_NAME")
+        self._wm_name = dpy.intern_atom("WM_NAME")
+        self._wm_client_machine = dpy.intern_atom("WM_CLIENT_MACHINE")
+        self._utf8_string = dpy.intern_atom("UTF8_STRING")
+        self._dpy = dpy
     
     def find_roblox_window(self) -> Optional[WindowHandle]:
         """
         Find the Roblox window, preferring "The Forge" game window.
         Returns the WindowHandle if found, None otherwise.
         """
-        windows = self._enumerate_windows()
-        
-        # First, try to find "The Forge" specifically
-        for window in windows:
-            if "The Forge" in window.title or "forge" in window.title.lower():
-                self._current_window = window
-                self._update_window_geometry(window)
-                return window
-        
-        # Fallback to any Roblox window
-        for window in windows:
-            for pattern in self.ROBLOX_PATTERNS:
-                if re.search(pattern, window.title, re.IGNORECASE):
-                    self._current_window = window
-                    self._update_window_geometry(window)
-                    return window
-        
-        self._current_window = None
-        return None
+        # While the last best-possible match is still the target and still
+        # open, a rescan could only find it again
+        last = self._last_forge_window
+        if last is not None and last is self._current_window and self.is_window_valid(last):
+            self._update_window_geometry(last)
+            return last
+        
+        # The pre-filter ranks each title once; the scan reuses the rank
+        ranks: Dict[str, int] = {}
+        
+        def is_candidate(title: str) -> bool:
+            rank = ranks[title] = self._title_rank(title)
+            return rank > 0
+        
+        best = None
+        self._last_forge_window = None
+        for window in self._enumerate_windows(is_candidate):
+            # A Forge window can't be beaten
+            if ranks[window.title] == 2:
+                best = self._last_forge_window = window
+                break
+            
+            # Otherwise fall back to the first Roblox window
+            if best is None:
+                best = window
+        
+        self._current_window = best
+        if best:
+            self._update_window_geometry(best)
+        return best
+    
+    def _title_rank(self, title: str) -> int:
+        """Rank a title for find_roblox_window: 2 Forge, 1 Roblox, 0 neither"""
+        title = title.lower()
+        if "forge" in title:
+            return 2
+        return 1 if any(needle in title for needle in self.ROBLOX_TITLES) else 0
     
     def get_all_windows(self) -> List[WindowHandle]:
         """
@@ -131,9 +221,20 @@ class WindowDetector:
                 return self.select_window(window)
         return False
     
-    def _enumerate_windows(self) -> List[WindowHandle]:
-        """Enumerate all windows using wmctrl"""
-        windows = []
+    def _enumerate_windows(
+        self,
+        title_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[WindowHandle]:
+        """
+        Enumerate windows using X11, or wmctrl as a fallback.
+        
+        Args:
+            title_filter: Optional predicate; windows whose title it rejects
+                are skipped before a WindowHandle is built for them
+        """
+        if self._dpy is not None:
+            return self._enumerate_windows_x11(title_filter)
+        
         try:
             result = subprocess.run(
                 ["wmctrl", "-l"],
@@ -141,26 +242,81 @@ class WindowDetector:
                 text=True,
                 check=True
             )
-            
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                # wmctrl output format: WINDOW_ID DESKTOP HOST TITLE
-                parts = line.split(None, 3)
-                if len(parts) >= 4:
-                    window_id, desktop, host, title = parts[0], parts[1], parts[2], parts[3]
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            logger.error("Error enumerating windows: %s", e)
+            return []
+        
+        return [
+            WindowHandle(window_id=m[1], title=m[3], process_name=m[2])
+            for m in _WMCTRL_LINE_RE.finditer(result.stdout)
+            if title_filter is None or title_filter(m[3])
+        ]
+    
+    def _enumerate_windows_x11(
+        self,
+        title_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[WindowHandle]:
+        """Enumerate managed windows from the root window's _NET_CLIENT_LIST"""
+        windows = []
+        with self._x_lock:
+            try:
+                prop = self._root.get_full_property(self._net_client_list, X.AnyPropertyType)
+                for wid in (prop.value if prop else ()):
+                    window = self._dpy.create_resource_object("window", wid)
+                    try:
+                        title = self._get_window_title(window)
+                        # Untitled windows are skipped, as with wmctrl; rejected
+                        # ones also save the client machine round trip
+                        if not title or (title_filter and not title_filter(title)):
+                            continue
+                        host = self._get_text_property(window, self._wm_client_machine)
+                    except (xerror.BadWindow, ValueError):
+                        continue  # closed since the list was read, or garbled
                     windows.append(WindowHandle(
-                        window_id=window_id,
+                        window_id=f"0x{wid:08x}",
                         title=title,
-                        process_name=host
+                        process_name=host or "N/A"
                     ))
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            print(f"Error enumerating windows: {e}")
+            except (xerror.XError, xerror.ConnectionClosedError) as e:
+                logger.error("Error enumerating windows: %s", e)
         
         return windows
     
+    def _get_window_title(self, window) -> Optional[str]:
+        """Read a window's title, preferring the UTF-8 _NET_WM_NAME"""
+        return (self._get_text_property(window, self._net_wm_name)
+                or self._get_text_property(window, self._wm_name))
+    
+    def _get_text_property(self, window, atom: int) -> Optional[str]:
+        """Read an 8-bit text property, decoding it leniently"""
+        # Raw read: python-xlib's own decode is strict and raises on e.g. a
+        # title truncated mid-character
+        prop = window.get_full_property(atom, X.AnyPropertyType)
+        if prop is None or prop.format != 8 or not prop.value:
+            return None
+        # STRING is Latin-1; types it can't decode (e.g. COMPOUND_TEXT) too
+        encoding = "utf-8" if prop.property_type == self._utf8_string else "latin-1"
+        return prop.value.decode(encoding, errors="replace")
+    
+    def _x11_window(self, window_id: str):
+        """Get the Xlib window object for a window ID string"""
+        return self._dpy.create_resource_object("window", int(window_id, 16))
+    
     def _update_window_geometry(self, window: WindowHandle) -> None:
-        """Update window geometry using xdotool"""
+        """Update window geometry using X11, or xdotool as a fallback"""
+        if self._dpy is not None:
+            self._update_window_geometry_x11(window)
+        else:
+            self._update_window_geometry_xdotool(window)
+        
+        # Also primes get_window_rect, e.g. right after find_roblox_window
+        self._geometry_cache[window.window_id] = (
+            Rectangle(x=window.x, y=window.y, width=window.width, height=window.height),
+            time.monotonic()
+        )
+    
+    def _update_window_geometry_xdotool(self, window: WindowHandle) -> None:
+        """Update window geometry with xdotool getwindowgeometry"""
         try:
             result = subprocess.run(
                 ["xdotool", "getwindowgeometry", "--shell", window.window_id],
@@ -168,18 +324,27 @@ class WindowDetector:
                 text=True,
                 check=True
             )
-            
-            for line in result.stdout.strip().split('\n'):
-                if line.startswith("X="):
-                    window.x = int(line.split("=")[1])
-                elif line.startswith("Y="):
-                    window.y = int(line.split("=")[1])
-                elif line.startswith("WIDTH="):
-                    window.width = int(line.split("=")[1])
-                elif line.startswith("HEIGHT="):
-                    window.height = int(line.split("=")[1])
-        except (subprocess.CalledProcessError, FileNotFoundError, ValueError) as e:
-            print(f"Error getting window geometry: {e}")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            logger.error("Error getting window geometry: %s", e)
+            return
+        
+        m = _XDOTOOL_GEOMETRY_RE.search(result.stdout)
+        if m:
+            window.x, window.y, window.width, window.height = map(int, m.groups()[1:])
+    
+    def _update_window_geometry_x11(self, window: WindowHandle) -> None:
+        """Update window geometry with get_geometry and root-relative coordinates"""
+        with self._x_lock:
+            try:
+                x_window = self._x11_window(window.window_id)
+                geometry = x_window.get_geometry()
+                origin = self._root.translate_coords(x_window, 0, 0)
+                window.x = origin.x
+                window.y = origin.y
+                window.width = geometry.width
+                window.height = geometry.height
+            except (xerror.XError, xerror.ConnectionClosedError, ValueError) as e:
+                logger.error("Error getting window geometry: %s", e)
     
     def is_window_valid(self, handle: Optional[WindowHandle] = None) -> bool:
         """Check if the window handle is still valid"""
@@ -187,6 +352,15 @@ class WindowDetector:
         if not target:
             return False
         
+        if self._dpy is not None:
+            with self._x_lock:
+                try:
+                    # Any request on a destroyed window fails with BadWindow
+                    self._x11_window(target.window_id).get_wm_name()
+                    return True
+                except (xerror.XError, xerror.ConnectionClosedError, ValueError):
+                    return False
+        
         try:
             # Try to get window info - will fail if window doesn't exist
             result = subprocess.run(
@@ -204,13 +378,12 @@ class WindowDetector:
         if not target:
             return None
         
+        cached = self._geometry_cache.get(target.window_id)
+        if cached and time.monotonic() - cached[1] < self.GEOMETRY_TTL_S:
+            return cached[0]
+        
         self._update_window_geometry(target)
-        return Rectangle(
-            x=target.x,
-            y=target.y,
-            width=target.width,
-            height=target.height
-        )
+        return self._geometry_cache[target.window_id][0]
     
     def get_click_position(self) -> Optional[tuple[int, int]]:
         """Get the center position of the target window for clicking"""
@@ -223,54 +396,265 @@ class WindowDetector:
         """Register a callback for window state changes"""
         self._state_callbacks.append(callback)
     
-    def start_monitoring(self, interval_seconds: float = 1.0) -> None:
-        """Start monitoring window state in background"""
-        if self._monitoring:
+    def start_monitoring(
+        self,
+        interval_seconds: float = 1.0,
+        max_interval_seconds: float = 5.0
+    ) -> None:
+        """
+        Start monitoring window state in background.
+        
+        Polls every interval_seconds after a state change, backing off
+        towards max_interval_seconds while the state stays the same.
+        """
+        if not self._monitor_stop.is_set():
             return
         
-        self._monitoring = True
+        self._monitor_stop.clear()
+        self._monitor_wake.clear()
         self._monitor_thread = threading.Thread(
             target=self._monitor_loop,
-            args=(interval_seconds,),
+            args=(interval_seconds, max(interval_seconds, max_interval_seconds)),
             daemon=True
         )
         self._monitor_thread.start()
     
     def stop_monitoring(self) -> None:
         """Stop monitoring window state"""
-        self._monitoring = False
+        self._monitor_stop.set()
+        self._monitor_wake.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
             self._monitor_thread = None
     
-    def _monitor_loop(self, interval: float) -> None:
+    def _monitor_loop(self, min_interval: float, max_interval: float) -> None:
         """Background thread that monitors window state"""
+        # On X11, wait for the window list to change instead of polling;
+        # the max interval then only serves as a safety net
+        unsubscribe = None
+        if sys.platform != "win32":
+            unsubscribe = self._subscribe_x11(self._monitor_wake.set)
+        try:
+            self._run_monitor(min_interval, max_interval, unsubscribe is not None)
+        finally:
+            if unsubscribe:
+                unsubscribe()
+    
+    def _run_monitor(self, min_interval: float, max_interval: float, event_driven: bool) -> None:
+        """Poll (or wait for window events) until monitoring stops"""
         was_valid = self.is_window_valid()
+        interval = min_interval
         
-        while self._monitoring:
+        while not self._monitor_stop.is_set():
+            # Deadlines count from the poll's start, so time spent querying
+            # comes out of the sleep instead of stretching the poll period
+            poll_started = time.monotonic()
+            previous = was_valid
             is_valid = self.is_window_valid()
             
             if is_valid != was_valid:
-                for callback in self._state_callbacks:
-                    try:
-                        callback(is_valid)
-                    except Exception as e:
-                        print(f"Error in window state callback: {e}")
+                self._notify_state(is_valid)
                 was_valid = is_valid
             
-            # If window became invalid, try to find it again
+            # If window became invalid, try to find it again; a window it
+            # returns was just enumerated, so don't re-check it
             if not is_valid:
-                self.find_roblox_window()
-                is_valid = self.is_window_valid()
+                is_valid = self.find_roblox_window() is not None
                 if is_valid and not was_valid:
-                    for callback in self._state_callbacks:
-                        try:
-                            callback(True)
-                        except Exception as e:
-                            print(f"Error in window state callback: {e}")
+                    self._notify_state(True)
                     was_valid = True
             
-            time.sleep(interval)
+            if event_driven:
+                self._monitor_wake.wait(max_interval)
+                self._monitor_wake.clear()
+                continue
+            
+            # Poll densely right after a transition, sparsely once stable
+            if was_valid != previous:
+                interval = min_interval
+            else:
+                interval = min(interval * self.MONITOR_BACKOFF, max_interval)
+            
+            # Set only once the interval is known, so a transition's dense
+            # poll applies to the very next wait
+            next_deadline = poll_started + interval
+            delay = next_deadline - time.monotonic()
+            # Returns early, and true, as soon as stop_monitoring is called
+            if delay > 0 and self._monitor_stop.wait(delay):
+                return
+    
+    def _notify_state(self, is_valid: bool) -> None:
+        """Queue the state callbacks on the callback worker"""
+        # Snapshot, so registering a callback mid-dispatch is harmless
+        for callback in tuple(self._state_callbacks):
+            self._callback_executor.submit(self._run_state_callback, callback, is_valid)
+    
+    @staticmethod
+    def _run_state_callback(callback: Callable[[bool], None], is_valid: bool) -> None:
+        """Run a state callback, logging rather than losing its exception"""
+        try:
+            callback(is_valid)
+        except Exception:
+            logger.exception("Error in window state callback")
+    
+    def subscribe_changes(self, callback: Callable[[], None]) -> bool:
+        """
+        Call back whenever top-level windows are created, destroyed or
+        (on Windows) renamed, instead of polling for changes.
+        
+        On Windows this must be called from a thread running a message
+        loop (e.g. the Qt GUI thread). On X11 the callback runs on a
+        background thread.
+        
+        Args:
+            callback: Function to call when the window set changes
+            
+        Returns:
+            True if change events are supported; otherwise poll instead
+        """
+        self.unsubscribe_changes()
+        if sys.platform == "win32":
+            self._unsubscribe = self._subscribe_win32(callback)
+        else:
+            self._unsubscribe = self._subscribe_x11(callback)
+        return self._unsubscribe is not None
+    
+    def unsubscribe_changes(self) -> None:
+        """Stop delivering window change events"""
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+    
+    def _subscribe_x11(self, callback: Callable[[], None]) -> Optional[Callable[[], None]]:
+        """Watch _NET_CLIENT_LIST and client titles over a dedicated X connection"""
+        if xdisplay is None:
+            logger.warning("Window change events unavailable: python-xlib not installed")
+            return None
+        try:
+            dpy = xdisplay.Display()
+        except xerror.DisplayError as e:
+            logger.warning("Window change events unavailable: %s", e)
+            return None
+        
+        root = dpy.screen().root
+        client_list = dpy.intern_atom("_NET_CLIENT_LIST")
+        title_atoms = (dpy.intern_atom("_NET_WM_NAME"), dpy.intern_atom("WM_NAME"))
+        root.change_attributes(event_mask=X.PropertyChangeMask)
+        # A window may be gone before its event mask is set; ignore that
+        ignore_bad_window = xerror.CatchError(xerror.BadWindow)
+        watched = set()
+        
+        def watch_clients() -> None:
+            """Also get PropertyNotify for titles, e.g. a window retitled after mapping"""
+            nonlocal watched
+            prop = root.get_full_property(client_list, X.AnyPropertyType)
+            current = set(prop.value) if prop else set()
+            for wid in current - watched:
+                dpy.create_resource_object("window", wid).change_attributes(
+                    event_mask=X.PropertyChangeMask, onerror=ignore_bad_window
+                )
+            # The server drops selections of destroyed windows by itself
+            watched = current
+            dpy.flush()
+        
+        watch_clients()
+        
+        # Self-pipe so unsubscribing can wake the blocking select()
+        wake_r, wake_w = os.pipe()
+        
+        def watch() -> None:
+            try:
+                while True:
+                    if not dpy.pending_events():
+                        ready, _, _ = select.select([dpy.fileno(), wake_r], [], [])
+                        if wake_r in ready:
+                            return
+                    event = dpy.next_event()
+                    if event.type != X.PropertyNotify:
+                        continue
+                    if event.atom == client_list:
+                        watch_clients()
+                    elif event.atom not in title_atoms:
+                        continue
+                    try:
+                        callback()
+                    except Exception:
+                        logger.exception("Error in window change callback")
+            finally:
+                os.close(wake_r)
+                dpy.close()
+        
+        thread = threading.Thread(target=watch, daemon=True)
+        thread.start()
+        
+        def unsubscribe() -> None:
+            # The watcher closes wake_r when it exits (e.g. the X server went
+            # away), after which the write would raise BrokenPipeError
+            try:
+                if thread.is_alive():
+                    os.write(wake_w, b"x")
+                    thread.join(timeout=1.0)
+            except OSError:
+                pass
+            finally:
+                os.close(wake_w)
+        
+        return unsubscribe
+    
+    def _subscribe_win32(self, callback: Callable[[], None]) -> Optional[Callable[[], None]]:
+        """Register out-of-context WinEvent hooks for window create/destroy/rename"""
+        import ctypes
+        from ctypes import wintypes
+        
+        EVENT_OBJECT_CREATE = 0x8000
+        EVENT_OBJECT_DESTROY = 0x8001
+        EVENT_OBJECT_NAMECHANGE = 0x800C
+        WINEVENT_OUTOFCONTEXT = 0x0000
+        WINEVENT_SKIPOWNPROCESS = 0x0002
+        OBJID_WINDOW = 0
+        CHILDID_SELF = 0
+        
+        user32 = ctypes.windll.user32
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+        )
+        user32.SetWinEventHook.argtypes = (
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        )
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+        
+        def on_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+            if id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Error in window change callback")
+        
+        # Keep the ctypes callback alive for as long as the hooks exist
+        proc = WinEventProc(on_event)
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        # Two narrow ranges so chatty events in between (location, focus)
+        # never reach Python
+        hooks = [
+            user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_DESTROY, None, proc, 0, 0, flags),
+            user32.SetWinEventHook(EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, None, proc, 0, 0, flags),
+        ]
+        if not all(hooks):
+            for hook in filter(None, hooks):
+                user32.UnhookWinEvent(hook)
+            logger.warning("Window change events unavailable: SetWinEventHook failed")
+            return None
+        
+        def unsubscribe() -> None:
+            nonlocal proc
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+            proc = None
+        
+        return unsubscribe
     
     @property
     def current_window(self) -> Optional[WindowHandle]: